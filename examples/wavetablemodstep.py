@@ -14,6 +14,7 @@ all the waves in a selected wavetable in succession.
 
 """
 
+import sys
 import time
 
 import rtmidi
@@ -22,6 +23,20 @@ from rtmidi.midiconstants import (CONTROL_CHANGE, MODULATION_WHEEL,
 
 
 CC_SET_WAVETABLE = 70
+# time.sleep() on Windows has a granularity of several milliseconds,
+# so we busy-wait for the last part of each delay there.
+SPIN_TIME = 0.002 if sys.platform.startswith('win') else 0.0
+
+
+def sleep_until(deadline):
+    """Sleep until given ``time.perf_counter()`` value is reached."""
+    remaining = deadline - time.perf_counter()
+
+    if remaining > SPIN_TIME:
+        time.sleep(remaining - SPIN_TIME)
+
+    while time.perf_counter() < deadline:
+        pass
 
 
 class Midi(object):
@@ -31,23 +46,57 @@ class Midi(object):
         self.midi = rtmidi.MidiOut()
         self.midi.open_port(port)
 
+    def send_scheduled(self, events, base_time=None):
+        """Send MIDI messages at given points in time.
+
+        ``events`` is a sequence of ``(offset, message)`` tuples, where
+        ``offset`` is the time in seconds, relative to ``base_time``, at which
+        the message should be sent. ``base_time`` is a ``time.perf_counter()``
+        value and defaults to the current time.
+
+        Each deadline is computed from ``base_time``, not from the time the
+        previous message was sent, so timing errors do not accumulate.
+        Offsets must be in ascending order.
+
+        """
+        if base_time is None and hasattr(self.midi, 'send_message_list'):
+            # Submit all messages at once and let python-rtmidi time their
+            # dispatch without holding the GIL.
+            deltas = []
+            last = 0.0
+
+            for offset, message in events:
+                deltas.append((offset - last, message))
+                last = offset
+
+            self.midi.send_message_list(deltas)
+            return
+
+        if base_time is None:
+            base_time = time.perf_counter()
+
+        for offset, message in events:
+            sleep_until(base_time + offset)
+            self.midi.send_message(message)
+
     def play_stepping(self, note, cc, dur=0.2, step=1, vel=64, rvel=None, ch=0):
         """Play given note and step through ctrl values over time."""
-        # note on
         note &= 0x7F
         ch &= 0x0F
-        self.midi.send_message([CONTROL_CHANGE | ch, cc, 0])
-        time.sleep(0.1)
-        self.midi.send_message([NOTE_ON | ch, note, vel & 0x7F])
-
+        cc_status = CONTROL_CHANGE | ch
+        steps = range(0, 128, step)
+        # reset controller, note on
+        events = [
+            (0.0, bytes((cc_status, cc, 0))),
+            (0.1, bytes((NOTE_ON | ch, note, vel & 0x7F)))
+        ]
         # step through modulation controller values
-        for i in range(0, 128, step):
-            self.midi.send_message([CONTROL_CHANGE | ch, cc, i])
-            time.sleep(dur)
-
+        events.extend((0.1 + n * dur, bytes((cc_status, cc, i)))
+                      for n, i in enumerate(steps))
         # note off
-        self.midi.send_message(
-            [NOTE_OFF | ch, note, (vel if rvel is None else rvel) & 0x7F])
+        events.append((0.1 + len(steps) * dur,
+                       bytes((NOTE_OFF | ch, note, (vel if rvel is None else rvel) & 0x7F))))
+        self.send_scheduled(events)
 
     def reset_controllers(self, ch=0):
         """Reset controllers on given channel."""
@@ -94,6 +143,8 @@ if __name__ == '__main__':
 
     try:
         m.reset_controllers(ch)
+        # send_message_list checks for signals while waiting, so Ctrl-C
+        # stops the sweep before the controllers are reset below.
         m.play_stepping(args.note, args.controller, dur=args.length, step=2, ch=ch)
     finally:
         m.reset_controllers(ch)
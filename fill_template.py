@@ -5,13 +5,10 @@ meta-data.
 
 """
 
-from os.path import join
-from string import Template
+import re
 
-try:
-    basestring  # noqa
-except:
-    basestring = str
+from concurrent.futures import ThreadPoolExecutor
+from os.path import join
 
 from distutils.core import Command
 from distutils.dist import DistributionMetadata
@@ -22,6 +19,48 @@ from distutils.util import split_quoted
 DistributionMetadata.templates = None
 
 
+# Matches the same placeholders as 'string.Template': $$, $name and ${name}
+TEMPLATE_RX = re.compile(r'\$(?:(?P<escaped>\$)|(?P<named>[_a-z][_a-z0-9]*)|'
+                         r'{(?P<braced>[_a-z][_a-z0-9]*)})', re.ASCII | re.IGNORECASE)
+# Matches a possibly incomplete placeholder at the end of a chunk of text
+PARTIAL_RX = re.compile(r'\$+{?\w*\Z')
+# Size of chunks in which template files are read and written
+CHUNK_SIZE = 64 * 1024
+
+
+def safe_substitute(text, mapping):
+    """Replace placeholders in text like 'string.Template.safe_substitute'."""
+    def replace(match):
+        if match.group('escaped') is not None:
+            return '$'
+
+        try:
+            return str(mapping[match.group('named') or match.group('braced')])
+        except KeyError:
+            return match.group(0)
+
+    return TEMPLATE_RX.sub(replace, text)
+
+
+def fill_template(infile, outfile, mapping, chunk_size=CHUNK_SIZE):
+    """Copy infile to outfile chunk-wise, replacing placeholders from mapping."""
+    pending = ''
+
+    while True:
+        chunk = infile.read(chunk_size)
+
+        if not chunk:
+            outfile.write(safe_substitute(pending, mapping))
+            break
+
+        text = pending + chunk
+        # Hold back a placeholder, which may be cut off at the chunk boundary
+        match = PARTIAL_RX.search(text)
+        split = match.start() if match else len(text)
+        outfile.write(safe_substitute(text[:split], mapping))
+        pending = text[split:]
+
+
 class FillTemplate(Command):
     """Custom distutils command to fill text templates with release meta data.
     """
@@ -35,9 +74,10 @@ class FillTemplate(Command):
     def initialize_options(self):
         self.templates = ''
         self.template_ext = '.in'
+        self._metadata = None
 
     def finalize_options(self):
-        if isinstance(self.templates, basestring):
+        if isinstance(self.templates, str):
             self.templates = split_quoted(self.templates)
 
         self.templates += getattr(self.distribution.metadata, 'templates', None) or []
@@ -48,26 +88,35 @@ class FillTemplate(Command):
                                  "extension '%s'." % (tmpl, self.template_ext))
 
     def run(self):
+        if not self.templates:
+            return
+
         metadata = self.get_metadata()
+        # Templates are independent of each other, so fill them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(self.templates))) as executor:
+            list(executor.map(lambda tmpl: self._render_one(tmpl, metadata), self.templates))
+
+    def _render_one(self, infilename, metadata):
+        try:
+            info("Reading template '%s'...", infilename)
+            with open(infilename) as infile:
+                outfilename = infilename.rstrip(self.template_ext)
+
+                info("Writing filled template to '%s'.", outfilename)
+                with open(outfilename, 'w', buffering=CHUNK_SIZE) as outfile:
+                    fill_template(infile, outfile, metadata)
+        except:
+            error("Could not open template '%s'.", infilename)
 
-        for infilename in self.templates:
-            try:
-                info("Reading template '%s'...", infilename)
-                with open(infilename) as infile:
-                    tmpl = Template(infile.read())
-                    outfilename = infilename.rstrip(self.template_ext)
+    def get_metadata(self):
+        if self._metadata is None:
+            data = {attr: value
+                    for attr, value in vars(self.distribution.metadata).items()
+                    if not callable(value)}
 
-                    info("Writing filled template to '%s'.", outfilename)
-                    with open(outfilename, 'w') as outfile:
-                        outfile.write(tmpl.safe_substitute(metadata))
-            except:
-                error("Could not open template '%s'.", infilename)
+            with open(join("src", '_rtmidi.cpp')) as cppfile:
+                data['cpp_info'] = cppfile.readline().strip()
 
-    def get_metadata(self):
-        data = dict()
-        for attr in self.distribution.metadata.__dict__:
-            if not callable(attr):
-                data[attr] = getattr(self.distribution.metadata, attr)
+            self._metadata = data
 
-        data['cpp_info'] = open(join("src", '_rtmidi.cpp')).readline().strip()
-        return data
+        return self._metadata
@@ -2,14 +2,16 @@
 # -*- coding: utf-8 -*-
 """Setup file for the Cython rtmidi wrapper."""
 
-from __future__ import print_function
-
+import json
+import os
+import re
 import subprocess
 import sys
+import sysconfig
 
+from concurrent.futures import ThreadPoolExecutor
 from ctypes.util import find_library
 from os.path import dirname, exists, join
-from string import Template
 
 from setuptools import setup  # needs to stay before the imports below!
 import distutils
@@ -25,21 +27,105 @@ try:
 except ImportError:
     cythonize = None
 
-try:
-    basestring  # noqa
-except:
-    basestring = str
-
 DistributionMetadata.templates = None
 
 
-
 JACK1_MIN_VERSION = StrictVersion('0.125.0')
 JACK2_MIN_VERSION = StrictVersion('1.9.11')
+# Caches values parsed from source files between setup.py invocations
+SETUP_CACHE = join(dirname(__file__), '.setup_cache.json')
+# Where to look for 'jack/jack.h' before resorting to pkg-config. These are the
+# default header search directories of GCC and Clang, in their search order.
+JACK_INCLUDE_DIRS = ['/usr/local/include', '/usr/include']
+# Environment variables, which change where headers or pkg-config files are
+# looked up, so the default include directories may not be the ones used
+INCLUDE_PATH_VARS = ('CPATH', 'CPLUS_INCLUDE_PATH', 'PKG_CONFIG_PATH',
+                     'PKG_CONFIG_LIBDIR', 'PKG_CONFIG_SYSROOT_DIR')
+INCLUDE_PATH_FLAGS = ('-I', '-isystem', '-isysroot', '--sysroot')
+
+
+def _cached_read(path, parser):
+    """Return result of calling parser with file object for path.
+
+    The result must be JSON-serializable. It is cached in ``SETUP_CACHE`` and
+    re-used as long as the modification time (in nanoseconds) and size of the
+    file do not change.
+
+    """
+    st = os.stat(path)
+    key = [st.st_mtime_ns, st.st_size]
+
+    try:
+        with open(SETUP_CACHE) as fp:
+            cache = json.load(fp)
+    except (OSError, ValueError):
+        cache = {}
+
+    entry = cache.get(path)
+
+    if entry and entry.get('stat') == key:
+        return entry['value']
+
+    with open(path) as fp:
+        value = parser(fp)
+
+    cache[path] = {'stat': key, 'value': value}
+
+    try:
+        with open(SETUP_CACHE + '.tmp', 'w') as fp:
+            json.dump(cache, fp)
+
+        os.replace(SETUP_CACHE + '.tmp', SETUP_CACHE)
+    except OSError:
+        pass
+
+    return value
+
+
+def _parse_version_file(fp):
+    """Return the variables defined by executing the given Python file."""
+    data = {}
+    exec(fp.read(), {}, data)
+    return data
+
+
+def _get_jack_version():
+    """Return JACK version reported by pkg-config or None if not available."""
+    try:
+        res = subprocess.check_output(['pkg-config', '--modversion', 'jack'])
+        return StrictVersion(res.decode())
+    except (subprocess.CalledProcessError, UnicodeError, ValueError):
+        return None
+
+
+def _uses_default_include_dirs():
+    """Check whether the build only searches the compiler's default include dirs."""
+    if any(os.environ.get(var) for var in INCLUDE_PATH_VARS):
+        return False
 
+    flags = [os.environ.get(var, '') for var in ('CFLAGS', 'CPPFLAGS', 'CXXFLAGS')]
+    flags.append(sysconfig.get_config_var('CFLAGS') or '')
+    return not any(flag.startswith(INCLUDE_PATH_FLAGS)
+                   for flag in split_quoted(' '.join(flags)))
 
-def read(*args):
-    return open(join(dirname(__file__), *args)).read()
+
+def _jack_header_has_port_rename():
+    """Check whether 'jack/jack.h' declares the 'jack_port_rename' function.
+
+    The first header found in ``JACK_INCLUDE_DIRS`` is checked, i.e. the one
+    the compiler would use. Returns None if the header can not be found there
+    or if the build environment may add other include directories.
+
+    """
+    if not _uses_default_include_dirs():
+        return None
+
+    for incdir in JACK_INCLUDE_DIRS:
+        try:
+            with open(join(incdir, 'jack', 'jack.h'), 'rb') as header:
+                return b'jack_port_rename' in header.read()
+        except OSError:
+            pass
 
 
 def check_for_jack(define_macros, libraries):
@@ -48,23 +134,84 @@ def check_for_jack(define_macros, libraries):
     if find_library('jack'):
         define_macros.append(('__UNIX_JACK__', None))
 
-        # Check version of jack whether it is "new" enough to have the
-        # 'jack_port_rename' function:
-        try:
-            res = subprocess.check_output(['pkg-config', '--modversion', 'jack'])
-            jv = StrictVersion(res.decode())
-        except (subprocess.CalledProcessError, UnicodeError, ValueError):
-            pass
-        else:
-            print("Detected JACK version %s." % jv, file=sys.stderr)
-            if ((jv.version[0] == 0 and jv >= JACK1_MIN_VERSION) or
-                    (jv.version[0] == 1 and jv >= JACK2_MIN_VERSION)):
-                print("JACK version is recent enough to have 'jack_port_rename' function.",
-                      file=sys.stderr)
-                define_macros.append(('JACK_HAS_PORT_RENAME', None))
+        # Check whether jack is "new" enough to have the 'jack_port_rename'
+        # function. Look at the header first, since it saves running pkg-config.
+        has_port_rename = _jack_header_has_port_rename()
+
+        if has_port_rename is None:
+            jv = _get_jack_version()
+
+            if jv is not None:
+                print("Detected JACK version %s." % jv, file=sys.stderr)
+                has_port_rename = ((jv.version[0] == 0 and jv >= JACK1_MIN_VERSION) or
+                                   (jv.version[0] == 1 and jv >= JACK2_MIN_VERSION))
+
+        if has_port_rename:
+            print("JACK version is recent enough to have 'jack_port_rename' function.",
+                  file=sys.stderr)
+            define_macros.append(('JACK_HAS_PORT_RENAME', None))
 
         libraries.append('jack')
 
+
+def add_gcc_optimization_flags(compile_args, link_args, lto=True, native=False):
+    """Add GCC / Clang optimization flags to compile and link arguments."""
+    compile_args.append('-O3')
+
+    # Python < 3.9 does not mark the module init function as exported
+    if sys.version_info >= (3, 9):
+        compile_args.append('-fvisibility=hidden')
+
+    if lto:
+        compile_args.append('-flto')
+        link_args.append('-flto')
+
+    if native:
+        compile_args.append('-march=native')
+
+
+# Matches the same placeholders as 'string.Template': $$, $name and ${name}
+TEMPLATE_RX = re.compile(r'\$(?:(?P<escaped>\$)|(?P<named>[_a-z][_a-z0-9]*)|'
+                         r'{(?P<braced>[_a-z][_a-z0-9]*)})', re.ASCII | re.IGNORECASE)
+# Matches a possibly incomplete placeholder at the end of a chunk of text
+PARTIAL_RX = re.compile(r'\$+{?\w*\Z')
+# Size of chunks in which template files are read and written
+CHUNK_SIZE = 64 * 1024
+
+
+def safe_substitute(text, mapping):
+    """Replace placeholders in text like 'string.Template.safe_substitute'."""
+    def replace(match):
+        if match.group('escaped') is not None:
+            return '$'
+
+        try:
+            return str(mapping[match.group('named') or match.group('braced')])
+        except KeyError:
+            return match.group(0)
+
+    return TEMPLATE_RX.sub(replace, text)
+
+
+def fill_template(infile, outfile, mapping, chunk_size=CHUNK_SIZE):
+    """Copy infile to outfile chunk-wise, replacing placeholders from mapping."""
+    pending = ''
+
+    while True:
+        chunk = infile.read(chunk_size)
+
+        if not chunk:
+            outfile.write(safe_substitute(pending, mapping))
+            break
+
+        text = pending + chunk
+        # Hold back a placeholder, which may be cut off at the chunk boundary
+        match = PARTIAL_RX.search(text)
+        split = match.start() if match else len(text)
+        outfile.write(safe_substitute(text[:split], mapping))
+        pending = text[split:]
+
+
 class FillTemplate(Command):
     """Custom distutils command to fill text templates with release meta data.
     """
@@ -78,9 +225,10 @@ class FillTemplate(Command):
     def initialize_options(self):
         self.templates = ''
         self.template_ext = '.in'
+        self._metadata = None
 
     def finalize_options(self):
-        if isinstance(self.templates, basestring):
+        if isinstance(self.templates, str):
             self.templates = split_quoted(self.templates)
 
         self.templates += getattr(self.distribution.metadata, 'templates', None) or []
@@ -91,29 +239,38 @@ class FillTemplate(Command):
                                  "extension '%s'." % (tmpl, self.template_ext))
 
     def run(self):
+        if not self.templates:
+            return
+
         metadata = self.get_metadata()
+        # Templates are independent of each other, so fill them concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(self.templates))) as executor:
+            list(executor.map(lambda tmpl: self._render_one(tmpl, metadata), self.templates))
 
-        for infilename in self.templates:
-            try:
-                info("Reading template '%s'...", infilename)
-                with open(infilename) as infile:
-                    tmpl = Template(infile.read())
-                    outfilename = infilename.rstrip(self.template_ext)
+    def _render_one(self, infilename, metadata):
+        try:
+            info("Reading template '%s'...", infilename)
+            with open(infilename) as infile:
+                outfilename = infilename.rstrip(self.template_ext)
 
-                    info("Writing filled template to '%s'.", outfilename)
-                    with open(outfilename, 'w') as outfile:
-                        outfile.write(tmpl.safe_substitute(metadata))
-            except:
-                error("Could not open template '%s'.", infilename)
+                info("Writing filled template to '%s'.", outfilename)
+                with open(outfilename, 'w', buffering=CHUNK_SIZE) as outfile:
+                    fill_template(infile, outfile, metadata)
+        except:
+            error("Could not open template '%s'.", infilename)
 
     def get_metadata(self):
-        data = dict()
-        for attr in self.distribution.metadata.__dict__:
-            if not callable(attr):
-                data[attr] = getattr(self.distribution.metadata, attr)
+        if self._metadata is None:
+            data = {attr: value
+                    for attr, value in vars(self.distribution.metadata).items()
+                    if not callable(value)}
 
-        data['cpp_info'] = open(join("src", '_rtmidi.cpp')).readline().strip()
-        return data
+            data['cpp_info'] = _cached_read(join(SRC_DIR, '_rtmidi.cpp'),
+                                            lambda fp: fp.readline().strip())
+
+            self._metadata = data
+
+        return self._metadata
 
 
 class ToxTestCommand(distutils.cmd.Command):
@@ -150,8 +307,8 @@ DistributionMetadata.repository = None
 
 # Read version number from version.py (without importing the 'rtmidi' package,
 # since that would lead to hen-egg situation).
-setup_opts = {}
-exec(read(PKG_DIR, 'version.py'), {}, setup_opts)
+setup_opts = _cached_read(join(dirname(__file__), PKG_DIR, 'version.py'),
+                          _parse_version_file)
 
 # Add our own custom distutils command to create *.rst files from templates
 # Template files are listed in setup.cfg
@@ -180,7 +337,8 @@ include_dirs = [join(SRC_DIR, "rtmidi")]
 libraries = []
 extra_link_args = []
 extra_compile_args = []
-alsa = coremidi = jack = winmm = True
+alsa = coremidi = jack = winmm = lto = True
+native = False
 
 if '--no-alsa' in sys.argv:
     alsa = False
@@ -198,6 +356,14 @@ if '--no-winmm' in sys.argv:
     winmm = False
     sys.argv.remove('--no-winmm')
 
+if '--no-lto' in sys.argv:
+    lto = False
+    sys.argv.remove('--no-lto')
+
+if '--native' in sys.argv:
+    native = True
+    sys.argv.remove('--native')
+
 if '--no-suppress-warnings' not in sys.argv:
     define_macros.append(('__RTMIDI_SILENCE_WARNINGS__', None))
 else:
@@ -217,6 +383,8 @@ if sys.platform.startswith('linux'):
                  "Linux. Please install the libc6 development package.")
 
     libraries.append("pthread")
+
+    add_gcc_optimization_flags(extra_compile_args, extra_link_args, lto, native)
 elif sys.platform.startswith('darwin'):
     if jack:
         check_for_jack(define_macros, libraries)
@@ -228,8 +396,14 @@ elif sys.platform.startswith('darwin'):
             '-framework', 'CoreAudio',
             '-framework', 'CoreMIDI',
             '-framework', 'CoreFoundation'])
+
+    add_gcc_optimization_flags(extra_compile_args, extra_link_args, lto, native)
 elif sys.platform.startswith('win'):
-    extra_compile_args.append('/EHsc')
+    extra_compile_args.extend(['/EHsc', '/O2'])
+
+    if lto:
+        extra_compile_args.append('/GL')
+        extra_link_args.append('/LTCG')
 
     if winmm:
         define_macros.append(('__WINDOWS_MM__', None))
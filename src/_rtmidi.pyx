@@ -106,6 +106,8 @@ the `RtMidi API reference`_.
 import sys
 import warnings
 
+from cpython.exc cimport PyErr_CheckSignals
+from libc.string cimport memcpy
 from libcpp cimport bool
 from libcpp.string cimport string
 from libcpp.vector cimport vector
@@ -134,6 +136,15 @@ else:
 cdef extern from "pyinit.h":
     void py_init()
 
+cdef extern from "timing.h" nogil:
+    double steady_now()
+    void steady_sleep_until(double deadline)
+
+# Maximum time send_message_list sleeps before checking for signals
+cdef double SIGNAL_CHECK_INTERVAL = 0.05
+# Maximum delay (in seconds) between messages accepted by send_message_list
+cdef double MAX_MESSAGE_DELTA = 3600.0
+
 py_init()
 
 # Declarations for RtMidi C++ classes and their methods we use
@@ -220,6 +231,18 @@ cdef void _cb_error_func(ErrorType errorType, const string &errorText,
     func(errorType, decoder(errorText), data)
 
 
+cdef int _check_message(const unsigned char *data, size_t size) except -1:
+    """Raise ValueError if message is empty or an invalid SysEx message."""
+    if size == 0:
+        raise ValueError("'message' must not be empty.")
+
+    if size > 3 and data[0] != 0xF0:
+        raise ValueError("'message' longer than 3 bytes but does not "
+                         "start with 0xF0.")
+
+    return 0
+
+
 def _to_bytes(name):
     """Convert a unicode (Python 2) or str (Python 3) object into bytes."""
     # 'bytes' == 'str' in Python 2 but a separate type in Python 3
@@ -1002,6 +1025,7 @@ cdef class MidiOut(MidiBase):
     """
 
     cdef RtMidiOut *thisptr
+    cdef vector[unsigned char] _sendbuf
 
     cdef RtMidi* baseptr(self):
         return self.thisptr
@@ -1096,15 +1120,110 @@ cdef class MidiOut(MidiBase):
         """
         cdef vector[unsigned char] msg_v
 
-        if not message:
-            raise ValueError("'message' must not be empty.")
-
-        if len(message) > 3 and message[0] != 0xF0:
-            raise ValueError("'message' longer than 3 bytes but does not "
-                             "start with 0xF0.")
-
         for c in message:
             msg_v.push_back(c)
 
+        _check_message(msg_v.data(), msg_v.size())
+
         with nogil:
             self.thisptr.sendMessage(&msg_v)
+
+    def send_message_buffer(self, const unsigned char[::1] buf):
+        """Send a MIDI message given as a bytes-like object to the output port.
+
+        Works like ``send_message``, but the message must be passed as an
+        object supporting the buffer protocol with a contiguous array of bytes,
+        e.g. ``bytes``, ``bytearray`` or a ``memoryview`` of these. The data is
+        copied to an internal buffer in one go instead of converting each
+        element separately, which makes this the fastest way to send a message.
+
+        Since the internal buffer is reused for every message, this method must
+        not be called on the same ``MidiOut`` instance from several threads at
+        once.
+
+        Exceptions:
+
+        ``ValueError``
+            Raised if ``buf`` is empty or more than 3 bytes long and not a
+            SysEx message.
+
+        """
+        cdef size_t size = buf.shape[0]
+        cdef const unsigned char *data = NULL
+
+        if size > 0:
+            data = &buf[0]
+
+        _check_message(data, size)
+
+        with nogil:
+            self._sendbuf.resize(size)
+            memcpy(self._sendbuf.data(), data, size)
+            self.thisptr.sendMessage(&self._sendbuf)
+
+    def send_message_list(self, events):
+        """Send a sequence of MIDI messages with given delays between them.
+
+        ``events`` must be an iterable of ``(delta, message)`` tuples, where
+        ``delta`` is the time in seconds to wait before sending ``message``,
+        counted from the scheduled time of the previous message resp., for the
+        first message, from the time of the method call. Each message must be
+        an iterable yielding integers, as for ``send_message``.
+
+        All messages are validated and converted before the first one is sent.
+        They are then dispatched by a loop, which is timed against a monotonic
+        clock and runs with the global interpreter lock released. Since each
+        delay is relative to the scheduled, not the actual, time of the
+        previous message, timing errors do not accumulate.
+
+        This method blocks until the last message has been sent. While waiting,
+        it checks for signals at least every 50 ms, so e.g. pressing Ctrl-C
+        raises ``KeyboardInterrupt`` promptly and no further messages are sent.
+
+        Exceptions:
+
+        ``ValueError``
+            Raised if any ``delta`` is not a number between 0 and 3600 seconds
+            (NaN and infinity are rejected) or any message is empty or more
+            than 3 bytes long and not a SysEx message. No message is sent in
+            this case.
+
+        """
+        cdef vector[vector[unsigned char]] msgs
+        cdef vector[double] deltas
+        cdef vector[unsigned char] msg_v
+        cdef double deadline, now, delta
+        cdef size_t i
+
+        for delta, message in events:
+            # also false for NaN
+            if not 0.0 <= delta <= MAX_MESSAGE_DELTA:
+                raise ValueError("'delta' must be a number between 0 and %g "
+                                 "seconds." % MAX_MESSAGE_DELTA)
+
+            msg_v.clear()
+
+            for c in message:
+                msg_v.push_back(c)
+
+            _check_message(msg_v.data(), msg_v.size())
+
+            msgs.push_back(msg_v)
+            deltas.push_back(delta)
+
+        with nogil:
+            deadline = steady_now()
+
+            for i in range(msgs.size()):
+                deadline += deltas[i]
+                now = steady_now()
+
+                while now < deadline:
+                    steady_sleep_until(min(deadline, now + SIGNAL_CHECK_INTERVAL))
+
+                    with gil:
+                        PyErr_CheckSignals()
+
+                    now = steady_now()
+
+                self.thisptr.sendMessage(&msgs[i])
@@ -0,0 +1,20 @@
+#include <chrono>
+#include <thread>
+/*
+ * Monotonic clock helpers used by MidiOut.send_message_list to time the
+ * dispatch of a list of MIDI messages without holding the GIL.
+ *
+ * Times are expressed as seconds (double) on the std::chrono::steady_clock
+ * time scale, so they can be handled easily on the Cython side.
+ */
+
+static inline double steady_now() {
+    return std::chrono::duration<double>(
+        std::chrono::steady_clock::now().time_since_epoch()).count();
+}
+
+static inline void steady_sleep_until(double deadline) {
+    std::this_thread::sleep_until(std::chrono::steady_clock::time_point(
+        std::chrono::duration_cast<std::chrono::steady_clock::duration>(
+            std::chrono::duration<double>(deadline))));
+}
@@ -97,6 +97,18 @@ class BaseTests:
         assert self.midi_in.get_current_api() == self.API
         assert self.midi_out.get_current_api() == self.API
 
+    def test_send_message_buffer_invalid(self):
+        self.assertRaises(ValueError, self.midi_out.send_message_buffer, b'')
+        self.assertRaises(ValueError, self.midi_out.send_message_buffer, b'\x90\x30\x64\x00')
+        self.assertRaises(TypeError, self.midi_out.send_message_buffer, self.NOTE_ON)
+
+    def test_send_message_list_invalid(self):
+        for delta in (-0.1, float('nan'), float('inf'), 1e300):
+            self.assertRaises(ValueError, self.midi_out.send_message_list,
+                              [(0.0, self.NOTE_ON), (delta, self.NOTE_OFF)])
+        self.assertRaises(ValueError, self.midi_out.send_message_list,
+                          [(0.0, self.NOTE_ON), (0.0, [])])
+
 
 class VirtualPortsSupportedTests:
     def test_is_port_open_virtual(self):
@@ -123,6 +135,26 @@ class VirtualPortsSupportedTests:
         self.assertEqual(message_1, self.NOTE_ON)
         self.assertEqual(message_2, self.NOTE_OFF)
 
+    def test_send_message_buffer(self):
+        self.set_up_loopback()
+        self.midi_out.send_message_buffer(bytes(self.NOTE_ON))
+        self.midi_out.send_message_buffer(memoryview(bytearray(self.NOTE_OFF)))
+        time.sleep(self.DELAY)
+        message_1, _ = self.midi_in.get_message()
+        message_2, _ = self.midi_in.get_message()
+        self.assertEqual(message_1, self.NOTE_ON)
+        self.assertEqual(message_2, self.NOTE_OFF)
+
+    def test_send_message_list(self):
+        self.set_up_loopback()
+        self.midi_out.send_message_list([(0.0, self.NOTE_ON), (self.DELAY, self.NOTE_OFF)])
+        time.sleep(self.DELAY)
+        message_1, _ = self.midi_in.get_message()
+        message_2, delta_time = self.midi_in.get_message()
+        self.assertEqual(message_1, self.NOTE_ON)
+        self.assertEqual(message_2, self.NOTE_OFF)
+        self.assertGreaterEqual(delta_time, self.DELAY / 2)
+
     def test_callback(self):
         messages = []
 